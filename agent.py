@@ -1,32 +1,36 @@
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
 
-def fetch_cnn_paragraphs(url: str) -> list:
-    # 1. 自訂 headers（可依需求增減）
-    headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/137.0.0.0 Safari/537.36"
-        ),
-        "Accept-Language": "zh-TW,zh;q=0.9,en;q=0.8",
-        # 其他 headers 如必要可補充：Cookie、Referer...
-    }
+# 共用 Session，重複呼叫時沿用已建立的連線（keep-alive）
+_SESSION = requests.Session()
+# 自訂 headers（可依需求增減）
+_SESSION.headers.update({
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/137.0.0.0 Safari/537.36"
+    ),
+    "Accept-Language": "zh-TW,zh;q=0.9,en;q=0.8",
+    # 其他 headers 如必要可補充：Cookie、Referer...
+})
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
 
-    # 2. 發送 GET 請求
-    response = requests.get(url, headers=headers, timeout=10)
+def fetch_cnn_paragraphs(url: str) -> list:
+    # 1. 發送 GET 請求
+    response = _SESSION.get(url, timeout=10)
 
-    # 3. 檢查回應狀態
+    # 2. 檢查回應狀態
     if response.status_code != 200:
         raise Exception(f"HTTP {response.status_code}: 無法抓取頁面")
 
-    # 4. 解析 HTML
-    soup = BeautifulSoup(response.text, 'html.parser')
+    # 3. 解析 HTML
+    soup = BeautifulSoup(response.content, 'lxml')
     
-    # 5. 尋找指定 class 的段落
+    # 4. 尋找指定 class 的段落
     paragraphs = soup.find_all(class_="paragraph-elevate inline-placeholder vossi-paragraph")
     
-    # 6. 提取文字內容
+    # 5. 提取文字內容
     paragraph_texts = []
     for p in paragraphs:
         text = p.get_text(strip=True)
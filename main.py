@@ -1,24 +1,235 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
+from lxml import html as lxml_html
+import aiohttp
+import asyncio
 import json
 import time
 import csv
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
 import logging
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urljoin
 import re
 import os
 
+try:
+    import orjson
+except ImportError:  # 未安裝 orjson 時退回標準庫 json
+    orjson = None
+
+try:
+    import brotli  # noqa: F401  aiohttp 與 urllib3 解碼 br 回應時需要
+except ImportError:
+    try:
+        import brotlicffi as brotli  # noqa: F401
+    except ImportError:  # 未安裝 Brotli 解碼器時不宣告 br，避免收到無法解碼的回應
+        brotli = None
+
 # 設置日誌
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# 預先編譯的日期解析規則
+# ISO格式日期 (CNN常用格式)
+_ISO_PATTERNS = tuple(re.compile(p) for p in (
+    r'(\d{4}-\d{2}-\d{2})T\d{2}:\d{2}:\d{2}',  # 2025-07-28T12:34:56
+    r'(\d{4}-\d{2}-\d{2})\s+\d{2}:\d{2}:\d{2}', # 2025-07-28 12:34:56
+))
+
+# 各種日期格式
+_DATE_PATTERNS = tuple((re.compile(p), t) for p, t in (
+    (r'(\d{1,2})/(\d{1,2})/(\d{4})', 'mdy'),   # MM/DD/YYYY
+    (r'(\d{4})-(\d{1,2})-(\d{1,2})', 'ymd'),   # YYYY-MM-DD
+    (r'(\d{1,2})-(\d{1,2})-(\d{4})', 'dmy'),   # DD-MM-YYYY
+    (r'(\w+)\s+(\d{1,2}),\s+(\d{4})', 'mdy_name'), # Month DD, YYYY
+    (r'(\d{1,2})\s+(\w+)\s+(\d{4})', 'dmy_name'),  # DD Month YYYY
+))
+
+# 接受的CNN網址前綴，用於在正則比對前快速排除
+_CNN_URL_PREFIXES = (
+    'https://edition.cnn.com/', 'http://edition.cnn.com/',
+    'https://www.cnn.com/', 'http://www.cnn.com/',
+)
+
+# 有效文章URL：不在排除路徑中、路徑包含去年或今年的年份或 /world/
+# 年份取自爬蟲實例的 today_date，由 CNNWorldScraper.__init__ 代入後編譯
+_ARTICLE_URL_PATTERN = (
+    r'^https?://[^/?#]+'
+    r'(?![^?#]*/(?:videos|video|gallery|galleries|live-news|profiles|about|contact'
+    r'|search|newsletters|audio|podcasts)/)'
+    r'(?=[^?#]*(?:{last_year}|{year}|/world/))'
+)
+
+_MONTH_DICT = {
+    'january': 1, 'february': 2, 'march': 3, 'april': 4,
+    'may': 5, 'june': 6, 'july': 7, 'august': 8,
+    'september': 9, 'october': 10, 'november': 11, 'december': 12,
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'jun': 6,
+    'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12
+}
+
+def fetch_cnn_paragraphs_from_soup(soup):
+    """從已解析的頁面提取CNN文章段落"""
+    # 使用更精確的段落選擇器
+    paragraph_selectors = [
+        '.paragraph-elevate.inline-placeholder.vossi-paragraph',
+        '.zn-body__paragraph',
+        '.paragraph',
+        '.zn-body__paragraph p',
+        '[data-component-name="paragraph"] p',
+        '.BasicArticle__paragraph'
+    ]
+
+    paragraph_texts = []
+    selected = set()
+
+    # 合併為單一CSS選擇器，只遍歷一次DOM
+    for p in soup.select(', '.join(paragraph_selectors)):
+        selected.add(id(p))
+        # 巢狀命中時（如 .zn-body__paragraph 與其內的 p）只保留外層
+        if any(id(parent) in selected for parent in p.parents):
+            continue
+
+        # 以空白連接行內標籤的文字，避免相鄰單字黏在一起
+        text = p.get_text(' ', strip=True)
+        if text and len(text) > 20:  # 過濾太短的段落
+            paragraph_texts.append(text)
+
+    return paragraph_texts
+
+def parse_article_html(html, url):
+    """從HTML解析文章內容（模組層級函式，可交由子行程執行）"""
+    soup = BeautifulSoup(html, 'lxml')
+
+    # 嘗試提取文章信息
+    article_data = {
+        'url': url,
+        'title': '',
+        'content': '',
+        'paragraphs': [],
+        'author': '',
+        'publish_date': '',
+        'tags': [],
+        'scraped_at': datetime.now().isoformat()
+    }
+
+    # 提取標題
+    title_selectors = [
+        'h1.headline__text',
+        'h1[data-editable="headline"]',
+        'h1.pg-headline',
+        'h1',
+        '.headline__text'
+    ]
+
+    # 選擇器依優先順序排列，逐一查詢並取第一個命中的（合併查詢會改以文件順序決定）
+    for selector in title_selectors:
+        title_elem = soup.select_one(selector)
+        if title_elem:
+            article_data['title'] = title_elem.get_text(strip=True)
+            break
+
+    # 提取段落：所有段落選擇器已合併為單一查詢，不需再回退
+    paragraphs = fetch_cnn_paragraphs_from_soup(soup)
+    article_data['paragraphs'] = paragraphs
+    article_data['content'] = '\n\n'.join(paragraphs)
+
+    # 提取作者
+    author_selectors = [
+        '.byline__name',
+        '.metadata__byline',
+        '[data-module="ArticleByline"] .byline__name',
+        '.byline'
+    ]
+
+    # 原始HTML中沒有相關class時直接跳過，避免多餘的樹遍歷
+    if b'byline' in html:
+        for selector in author_selectors:
+            author_elem = soup.select_one(selector)
+            if author_elem:
+                article_data['author'] = author_elem.get_text(strip=True)
+                break
+
+    # 提取發布日期
+    date_selectors = [
+        '.timestamp',
+        '.metadata__date',
+        '[data-module="ArticleByline"] .timestamp',
+        'time',
+        '.byline__timestamp',
+        '.article-meta time'
+    ]
+
+    if b'timestamp' in html or b'metadata__date' in html or b'<time' in html:
+        for selector in date_selectors:
+            date_elem = soup.select_one(selector)
+            if date_elem:
+                # 嘗試從多個屬性獲取日期
+                date_text = (date_elem.get('datetime') or 
+                           date_elem.get('data-timestamp') or 
+                           date_elem.get_text(strip=True))
+                article_data['publish_date'] = date_text
+                break
+
+    # 提取標籤
+    tag_selectors = [
+        '.metadata__section',
+        '.breadcrumb__link',
+        '.zn-tag'
+    ]
+
+    tags = []
+    if b'metadata__section' in html or b'breadcrumb__link' in html or b'zn-tag' in html:
+        for tag_elem in soup.select(', '.join(tag_selectors)):
+            tag_text = tag_elem.get_text(strip=True)
+            if tag_text and tag_text not in tags:
+                tags.append(tag_text)
+
+    article_data['tags'] = tags
+
+    return article_data
+
+class TokenBucket:
+    """非同步令牌桶限速器：平均每秒最多 rate 個請求，允許 capacity 個突發請求"""
+    def __init__(self, rate=2, capacity=None):
+        self.rate = rate
+        self.capacity = capacity or rate
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self):
+        """取得一個令牌，令牌不足時等待補充"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
 class CNNWorldScraper:
     def __init__(self, today_only=True, output_dir='cnn_news'):
         self.base_url = "https://edition.cnn.com"
         self.world_url = "https://edition.cnn.com/world"
         self.today_only = today_only
         self.today_date = datetime.now().date()
+        # URL中的今日日期 - CNN URL格式通常是 /YYYY/MM/DD/，只在初始化時格式化一次
+        t = self.today_date
+        self._today_tokens = (
+            t.strftime('/%Y/%m/%d'),    # /2025/07/28
+            t.strftime('-%Y-%m-%d'),    # -2025-07-28
+            t.strftime('%Y%m%d'),       # 20250728
+        )
+        self._today_url_re = re.compile('|'.join(map(re.escape, self._today_tokens)))
+        self._article_url_re = re.compile(
+            _ARTICLE_URL_PATTERN.format(last_year=t.year - 1, year=t.year))
         self.output_dir = output_dir
         
         # 創建輸出目錄
@@ -28,12 +239,20 @@ class CNNWorldScraper:
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/137.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'zh-TW,zh;q=0.9,en;q=0.8',
-            'Accept-Encoding': 'gzip, deflate',
+            'Accept-Encoding': 'gzip, deflate, br' if brotli is not None else 'gzip, deflate',
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
         }
         self.session = requests.Session()
         self.session.headers.update(self.headers)
+        # 加大連線池並交由 urllib3 處理重試與指數退避
+        retry = Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504])
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=retry)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        # 已下載頁面的快取 (URL -> HTML bytes)，供同步的 get_cached_html 避免重複下載同一篇文章
+        self._html_cache = {}
         
     def create_output_directory(self):
         """創建輸出目錄"""
@@ -48,70 +267,41 @@ class CNNWorldScraper:
             # 如果無法創建目錄，使用當前目錄
             self.output_dir = '.'
         
-    def get_page(self, url, retries=3):
-        """獲取網頁內容"""
-        for attempt in range(retries):
-            try:
-                response = self.session.get(url, timeout=10)
-                response.raise_for_status()
-                return response
-            except requests.exceptions.RequestException as e:
-                logger.warning(f"嘗試 {attempt + 1} 失敗: {e}")
-                if attempt < retries - 1:
-                    time.sleep(2 ** attempt)  # 指數退避
-                else:
-                    logger.error(f"無法獲取頁面: {url}")
-                    return None
+    def get_html(self, url):
+        """獲取網頁HTML (bytes)"""
+        try:
+            response = self.session.get(url, timeout=10)
+            response.raise_for_status()
+            return response.content
+        except requests.exceptions.RequestException as e:
+            logger.error(f"無法獲取頁面: {url} ({e})")
+            return None
+    
+    def get_cached_html(self, url):
+        """獲取網頁HTML，已下載過的URL直接使用快取"""
+        html = self._html_cache.get(url)
+        if html is None:
+            html = self.get_html(url)
+            if html is None:
+                return None
+            self._html_cache[url] = html
+        return html
     
-    def extract_article_urls(self, soup):
+    def extract_article_urls(self, doc):
         """從頁面中提取文章URL"""
-        article_urls = set()
-        
-        # 尋找文章連結的各種可能選擇器
-        selectors = [
-            'a[href*="/world/"]',
-            'a[href*="/2024/"]',
-            'a[href*="/2025/"]',
-            '.card a',
-            '.container__link',
-            '.cd__headline-text',
-            'a.cd__headline-text',
-            '[data-module-name="card"] a'
-        ]
-        
-        for selector in selectors:
-            links = soup.select(selector)
-            for link in links:
-                href = link.get('href')
-                if href:
-                    # 轉換為絕對URL
-                    full_url = urljoin(self.base_url, href)
-                    
-                    # 過濾有效的文章URL
-                    if self.is_valid_article_url(full_url):
-                        article_urls.add(full_url)
+        # 直接以XPath取出所有連結字串，並轉換為絕對URL
+        hrefs = {urljoin(self.base_url, href) for href in doc.xpath('//a/@href')}
         
-        return list(article_urls)
+        # 過濾有效的文章URL
+        return [url for url in hrefs if self.is_valid_article_url(url)]
     
     def is_today_article(self, url):
         """檢查文章是否為今天發布"""
         if not self.today_only:
             return True
             
-        # 從URL中提取日期 - CNN URL格式通常是 /YYYY/MM/DD/
-        today_patterns = [
-            self.today_date.strftime('/%Y/%m/%d/'),    # /2025/07/28/
-            self.today_date.strftime('/%Y/%m/%d'),     # /2025/07/28
-            self.today_date.strftime('-%Y-%m-%d-'),    # -2025-07-28-
-            self.today_date.strftime('-%Y-%m-%d'),     # -2025-07-28
-            self.today_date.strftime('%Y%m%d'),        # 20250728
-        ]
-        
-        for pattern in today_patterns:
-            if pattern in url:
-                return True
-        
-        return False
+        # 從URL中提取日期
+        return bool(self._today_url_re.search(url))
     
     def parse_article_date(self, date_text):
         """解析文章日期文本"""
@@ -128,13 +318,8 @@ class CNNWorldScraper:
                 return self.today_date
         
         # 嘗試解析ISO格式日期 (CNN常用格式)
-        iso_patterns = [
-            r'(\d{4}-\d{2}-\d{2})T\d{2}:\d{2}:\d{2}',  # 2025-07-28T12:34:56
-            r'(\d{4}-\d{2}-\d{2})\s+\d{2}:\d{2}:\d{2}', # 2025-07-28 12:34:56
-        ]
-        
-        for pattern in iso_patterns:
-            match = re.search(pattern, date_text)
+        for pattern in _ISO_PATTERNS:
+            match = pattern.search(date_text)
             if match:
                 try:
                     date_str = match.group(1)
@@ -143,24 +328,8 @@ class CNNWorldScraper:
                     continue
         
         # 嘗試解析各種日期格式
-        date_patterns = [
-            (r'(\d{1,2})/(\d{1,2})/(\d{4})', 'mdy'),   # MM/DD/YYYY
-            (r'(\d{4})-(\d{1,2})-(\d{1,2})', 'ymd'),   # YYYY-MM-DD
-            (r'(\d{1,2})-(\d{1,2})-(\d{4})', 'dmy'),   # DD-MM-YYYY
-            (r'(\w+)\s+(\d{1,2}),\s+(\d{4})', 'mdy_name'), # Month DD, YYYY
-            (r'(\d{1,2})\s+(\w+)\s+(\d{4})', 'dmy_name'),  # DD Month YYYY
-        ]
-        
-        month_dict = {
-            'january': 1, 'february': 2, 'march': 3, 'april': 4,
-            'may': 5, 'june': 6, 'july': 7, 'august': 8,
-            'september': 9, 'october': 10, 'november': 11, 'december': 12,
-            'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
-            'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12
-        }
-        
-        for pattern, format_type in date_patterns:
-            match = re.search(pattern, date_text)
+        for pattern, format_type in _DATE_PATTERNS:
+            match = pattern.search(date_text)
             if match:
                 try:
                     groups = match.groups()
@@ -176,12 +345,12 @@ class CNNWorldScraper:
                             return datetime(int(year), int(month), int(day)).date()
                         elif format_type == 'mdy_name':  # Month DD, YYYY
                             month_name, day, year = groups
-                            month = month_dict.get(month_name.lower())
+                            month = _MONTH_DICT.get(month_name.lower())
                             if month:
                                 return datetime(int(year), month, int(day)).date()
                         elif format_type == 'dmy_name':  # DD Month YYYY
                             day, month_name, year = groups
-                            month = month_dict.get(month_name.lower())
+                            month = _MONTH_DICT.get(month_name.lower())
                             if month:
                                 return datetime(int(year), month, int(day)).date()
                 except (ValueError, TypeError):
@@ -191,41 +360,18 @@ class CNNWorldScraper:
     
     def is_valid_article_url(self, url):
         """檢查是否為有效的文章URL"""
-        parsed = urlparse(url)
-        
-        # 基本檢查
-        if not parsed.scheme or not parsed.netloc:
-            return False
-            
-        # 檢查是否為CNN域名
-        if 'cnn.com' not in parsed.netloc:
+        # 先以最便宜的前綴檢查排除非CNN網址
+        if not url.startswith(_CNN_URL_PREFIXES):
             return False
-            
-        # 過濾不需要的路徑
-        excluded_paths = [
-            '/videos/', '/video/', '/gallery/', '/galleries/',
-            '/live-news/', '/profiles/', '/about/', '/contact/',
-            '/search/', '/newsletters/', '/audio/', '/podcasts/'
-        ]
         
-        for excluded in excluded_paths:
-            if excluded in parsed.path:
-                return False
+        # 單一正則同時檢查排除路徑與年份
+        if not self._article_url_re.match(url):
+            return False
         
-        # 檢查是否包含年份（通常文章URL包含年份）
-        if any(year in parsed.path for year in ['2024', '2025']):
-            # 如果只要今天的新聞，進一步檢查日期
-            if self.today_only:
-                return self.is_today_article(url)
-            return True
-            
-        # 檢查是否為world相關文章
-        if '/world/' in parsed.path:
-            if self.today_only:
-                return self.is_today_article(url)
-            return True
-            
-        return False
+        # 如果只要今天的新聞，進一步檢查日期
+        if self.today_only:
+            return self.is_today_article(url)
+        return True
     
     def is_today_by_content(self, article_data):
         """通過文章內容判斷是否為今天的新聞"""
@@ -249,195 +395,98 @@ class CNNWorldScraper:
     def fetch_cnn_paragraphs(self, url):
         """使用新方法提取CNN文章段落"""
         try:
-            response = self.get_page(url)
-            if not response:
+            html = self.get_cached_html(url)
+            if not html:
                 return []
             
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # 使用更精確的段落選擇器
-            paragraph_selectors = [
-                '.paragraph-elevate.inline-placeholder.vossi-paragraph',
-                '.zn-body__paragraph',
-                '.paragraph',
-                '.zn-body__paragraph p',
-                '[data-component-name="paragraph"] p',
-                '.BasicArticle__paragraph'
-            ]
-            
-            paragraph_texts = []
-            
-            for selector in paragraph_selectors:
-                paragraphs = soup.find_all(class_=selector.replace('.', '').replace(' ', ' '))
-                if not paragraphs and '.' in selector:
-                    # 如果是class選擇器失敗，嘗試CSS選擇器
-                    paragraphs = soup.select(selector)
-                
-                for p in paragraphs:
-                    text = p.get_text(strip=True)
-                    if text and len(text) > 20:  # 過濾太短的段落
-                        paragraph_texts.append(text)
-                
-                # 如果找到段落就停止嘗試其他選擇器
-                if paragraph_texts:
-                    break
-            
-            return paragraph_texts
+            soup = BeautifulSoup(html, 'lxml')
+            return fetch_cnn_paragraphs_from_soup(soup)
             
         except Exception as e:
             logger.error(f"提取段落時發生錯誤 {url}: {e}")
             return []
     
+    async def _fetch(self, session, semaphore, rate_limiter, url, retries=3):
+        """非同步獲取網頁HTML（不寫入快取，頁面解析後即可釋放）"""
+        async with semaphore:
+            html = None
+            for attempt in range(retries):
+                await rate_limiter.acquire()  # 限制請求速率以避免被封鎖
+                try:
+                    async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
+                        response.raise_for_status()
+                        html = await response.read()
+                    break
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    logger.warning(f"嘗試 {attempt + 1} 失敗: {e}")
+                    if attempt < retries - 1:
+                        await asyncio.sleep(2 ** attempt)  # 指數退避
+                    else:
+                        logger.error(f"無法獲取頁面: {url}")
+            
+            return html
+    
     def extract_article_content(self, url):
         """提取文章內容 - 使用改進的方法"""
-        response = self.get_page(url)
-        if not response:
+        html = self.get_cached_html(url)
+        if not html:
             return None
-            
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # 嘗試提取文章信息
-        article_data = {
-            'url': url,
-            'title': '',
-            'content': '',
-            'paragraphs': [],
-            'author': '',
-            'publish_date': '',
-            'tags': [],
-            'scraped_at': datetime.now().isoformat()
-        }
-        
-        # 提取標題
-        title_selectors = [
-            'h1.headline__text',
-            'h1[data-editable="headline"]',
-            'h1.pg-headline',
-            'h1',
-            '.headline__text'
-        ]
-        
-        for selector in title_selectors:
-            title_elem = soup.select_one(selector)
-            if title_elem:
-                article_data['title'] = title_elem.get_text(strip=True)
-                break
-        
-        # 使用新的段落提取方法
-        paragraphs = self.fetch_cnn_paragraphs(url)
-        article_data['paragraphs'] = paragraphs
-        article_data['content'] = '\n\n'.join(paragraphs)
-        
-        # 如果新方法沒有內容，回退到舊方法
-        if not article_data['content']:
-            content_selectors = [
-                '.zn-body__paragraph',
-                '.paragraph',
-                '.zn-body__paragraph p',
-                '[data-component-name="paragraph"] p',
-                '.BasicArticle__paragraph'
-            ]
-            
-            content_parts = []
-            for selector in content_selectors:
-                paragraphs_old = soup.select(selector)
-                for p in paragraphs_old:
-                    text = p.get_text(strip=True)
-                    if text and len(text) > 20:  # 過濾太短的段落
-                        content_parts.append(text)
-            
-            article_data['content'] = '\n\n'.join(content_parts)
-            article_data['paragraphs'] = content_parts
-        
-        # 提取作者
-        author_selectors = [
-            '.byline__name',
-            '.metadata__byline',
-            '[data-module="ArticleByline"] .byline__name',
-            '.byline'
-        ]
-        
-        for selector in author_selectors:
-            author_elem = soup.select_one(selector)
-            if author_elem:
-                article_data['author'] = author_elem.get_text(strip=True)
-                break
-        
-        # 提取發布日期
-        date_selectors = [
-            '.timestamp',
-            '.metadata__date',
-            '[data-module="ArticleByline"] .timestamp',
-            'time',
-            '.byline__timestamp',
-            '.article-meta time'
-        ]
-        
-        for selector in date_selectors:
-            date_elem = soup.select_one(selector)
-            if date_elem:
-                # 嘗試從多個屬性獲取日期
-                date_text = (date_elem.get('datetime') or 
-                           date_elem.get('data-timestamp') or 
-                           date_elem.get_text(strip=True))
-                article_data['publish_date'] = date_text
-                break
-        
-        # 提取標籤
-        tag_selectors = [
-            '.metadata__section',
-            '.breadcrumb__link',
-            '.zn-tag'
-        ]
-        
-        tags = []
-        for selector in tag_selectors:
-            tag_elems = soup.select(selector)
-            for tag_elem in tag_elems:
-                tag_text = tag_elem.get_text(strip=True)
-                if tag_text and tag_text not in tags:
-                    tags.append(tag_text)
-        
-        article_data['tags'] = tags
         
-        return article_data
+        return parse_article_html(html, url)
     
-    def scrape_world_news(self, max_articles=20):
+    async def scrape_world_news_async(self, max_articles=20):
         """爬取CNN世界新聞"""
         logger.info("開始爬取CNN世界新聞...")
         logger.info(f"今天日期: {self.today_date.strftime('%Y-%m-%d')}")
         logger.info(f"只抓取當日新聞: {self.today_only}")
         
-        # 獲取世界新聞頁面
-        response = self.get_page(self.world_url)
-        if not response:
-            logger.error("無法獲取世界新聞頁面")
-            return []
-        
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # 提取文章URL
-        article_urls = self.extract_article_urls(soup)
-        logger.info(f"找到 {len(article_urls)} 個文章URL")
-        
-        # 如果是當日篩選，先過濾URL
-        if self.today_only:
-            today_urls = [url for url in article_urls if self.is_today_article(url)]
-            logger.info(f"URL中包含今日日期的文章: {len(today_urls)} 個")
-            article_urls = today_urls
-        
-        # 限制文章數量
-        if max_articles:
-            article_urls = article_urls[:max_articles]
+        semaphore = asyncio.Semaphore(5)
+        rate_limiter = TokenBucket(rate=2)
+        connector = aiohttp.TCPConnector(limit=8)
+        async with aiohttp.ClientSession(headers=self.headers, connector=connector) as session:
+            # 獲取世界新聞頁面
+            html = await self._fetch(session, semaphore, rate_limiter, self.world_url)
+            if not html:
+                logger.error("無法獲取世界新聞頁面")
+                return []
+            
+            doc = lxml_html.fromstring(html)
+            
+            # 提取文章URL（當日篩選已在 is_valid_article_url 中完成）
+            article_urls = self.extract_article_urls(doc)
+            logger.info(f"找到 {len(article_urls)} 個文章URL")
+            
+            # 限制文章數量
+            if max_articles:
+                article_urls = article_urls[:max_articles]
+            
+            # 並行爬取文章
+            logger.info(f"正在並行爬取 {len(article_urls)} 篇文章...")
+            htmls = await asyncio.gather(*(self._fetch(session, semaphore, rate_limiter, url) for url in article_urls))
+        
+        # 以多行程並行解析文章內容（每篇文章互相獨立）
+        fetched = [(url, html) for url, html in zip(article_urls, htmls) if html]
+        parsed = {}
+        if fetched:
+            logger.info(f"正在解析 {len(fetched)} 篇文章...")
+            urls, pages = zip(*fetched)
+            loop = asyncio.get_running_loop()
+            # 事件迴圈已有執行緒（如 aiohttp 的 DNS 解析），不可直接 fork，改用 forkserver/spawn 啟動子行程
+            mp_context = multiprocessing.get_context(
+                'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn')
+            with ProcessPoolExecutor(max_workers=min(len(fetched), os.cpu_count() or 1),
+                                     mp_context=mp_context) as executor:
+                results = await asyncio.gather(*(
+                    loop.run_in_executor(executor, parse_article_html, page, url)
+                    for url, page in zip(urls, pages)
+                ))
+            parsed = dict(zip(urls, results))
         
-        # 爬取文章內容
         articles = []
         today_articles = []
         
-        for i, url in enumerate(article_urls, 1):
-            logger.info(f"正在爬取文章 {i}/{len(article_urls)}: {url}")
-            
-            article_data = self.extract_article_content(url)
+        for url in article_urls:
+            article_data = parsed.get(url)
             if article_data and article_data['title']:
                 # 如果啟用了今天限制，檢查是否為今天的新聞
                 if self.today_only:
@@ -453,9 +502,6 @@ class CNNWorldScraper:
                     logger.info(f"成功爬取: {article_data['title'][:50]}...")
             else:
                 logger.warning(f"無法爬取文章內容: {url}")
-            
-            # 添加延遲以避免被封鎖
-            time.sleep(2)  # 增加延遲時間
         
         # 返回相應的結果
         final_articles = today_articles if self.today_only else articles
@@ -470,8 +516,12 @@ class CNNWorldScraper:
     def save_to_json(self, articles, filename='cnn_world_news.json'):
         """保存為JSON文件"""
         filepath = os.path.join(self.output_dir, filename)
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(articles, f, ensure_ascii=False, indent=2)
+        if orjson is not None:
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(articles, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(filepath, 'w', encoding='utf-8') as f:
+                json.dump(articles, f, ensure_ascii=False, indent=2)
         logger.info(f"已保存到 {filepath}")
     
     def save_detailed_content(self, articles, filename='cnn_detailed_content.txt'):
@@ -555,7 +605,7 @@ def main():
         print(f"開始爬取CNN世界新聞，最多 {max_articles} 篇...")
 
     # 爬取文章
-    articles = scraper.scrape_world_news(max_articles=max_articles)
+    articles = asyncio.run(scraper.scrape_world_news_async(max_articles=max_articles))
 
     # 存檔並列印摘要
     if articles:
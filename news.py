@@ -1,18 +1,140 @@
-import requests
-from bs4 import BeautifulSoup
+import asyncio
+import httpx
+from aiolimiter import AsyncLimiter
+from lxml import etree, html as lxml_html
+from lxml.cssselect import CSSSelector
 import json
-import time
 import csv
+from dataclasses import asdict, dataclass, field
 from datetime import datetime, timedelta
 import logging
 from urllib.parse import urljoin, urlparse
 import re
 import os
 
+try:
+    import orjson
+except ImportError:  # 未安裝 orjson 時退回標準庫 json
+    orjson = None
+
+try:
+    import ahocorasick
+except ImportError:  # 未安裝 pyahocorasick 時退回逐一子字串比對
+    ahocorasick = None
+
 # 設置日誌
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# 文章各欄位的選擇器
+_TITLE_SELECTORS = (
+    'h1.headline__text',
+    'h1[data-editable="headline"]',
+    'h1.pg-headline',
+    'h1',
+    '.headline__text',
+)
+_CONTENT_SELECTORS = (
+    '.zn-body__paragraph',
+    '.paragraph',
+    '.zn-body__paragraph p',
+    '[data-component-name="paragraph"] p',
+    '.BasicArticle__paragraph',
+)
+_AUTHOR_SELECTORS = (
+    '.byline__name',
+    '.metadata__byline',
+    '[data-module="ArticleByline"] .byline__name',
+    '.byline',
+)
+_DATE_SELECTORS = (
+    '.timestamp',
+    '.metadata__date',
+    '[data-module="ArticleByline"] .timestamp',
+    'time',
+    '.byline__timestamp',
+    '.article-meta time',
+)
+_TAG_SELECTORS = (
+    '.metadata__section',
+    '.breadcrumb__link',
+    '.zn-tag',
+)
+
+# 選擇器只在載入時編譯一次為XPath
+# 單一值欄位依優先順序逐一比對，每個選擇器各自編譯；多筆結果的欄位合併為單一查詢
+_TITLE_SELS = tuple(CSSSelector(s) for s in _TITLE_SELECTORS)
+_AUTHOR_SELS = tuple(CSSSelector(s) for s in _AUTHOR_SELECTORS)
+_DATE_SELS = tuple(CSSSelector(s) for s in _DATE_SELECTORS)
+_CONTENT_SEL = CSSSelector(', '.join(_CONTENT_SELECTORS))
+_TAG_SEL = CSSSelector(', '.join(_TAG_SELECTORS))
+
+# 不需要的路徑
+_EXCLUDED_PATHS = (
+    '/videos/', '/video/', '/gallery/', '/galleries/',
+    '/live-news/', '/profiles/', '/about/', '/contact/',
+    '/search/', '/newsletters/', '/audio/', '/podcasts/',
+)
+
+def _build_exclude_automaton():
+    """建立排除路徑的 Aho-Corasick 自動機，一次掃描即可比對所有排除路徑"""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for path in _EXCLUDED_PATHS:
+        automaton.add_word(path, path)
+    automaton.make_automaton()
+    return automaton
+
+_EXCLUDE_AC = _build_exclude_automaton()
+
+# 今天相關詞彙
+_TODAY_KEYWORDS = ('today', 'just now', 'minutes ago', 'hours ago', 'hour ago', 'minute ago')
+
+# 各種日期格式合併為單一交替正則，以外層具名群組區分格式，一次掃描即可
+_DATE_RE = re.compile(
+    r'(?P<mdy>(\d{1,2})/(\d{1,2})/(\d{4}))'              # MM/DD/YYYY
+    r'|(?P<ymd>(\d{4})-(\d{1,2})-(\d{1,2}))'             # YYYY-MM-DD
+    r'|(?P<dmy>(\d{1,2})-(\d{1,2})-(\d{4}))'             # DD-MM-YYYY
+    r'|(?P<mdy_name>(\w+)\.?\s+(\d{1,2}),\s+(\d{4}))'    # Month DD, YYYY / Oct. DD, YYYY
+    r'|(?P<dmy_name>(\d{1,2})\s+(\w+)\.?\s+(\d{4}))'     # DD Month YYYY / DD Oct. YYYY
+)
+
+# 月份全名與縮寫（CNN 常用 "Oct. 14" 這類縮寫）
+_MONTH_NAMES = {
+    'january': 1, 'february': 2, 'march': 3, 'april': 4,
+    'may': 5, 'june': 6, 'july': 7, 'august': 8,
+    'september': 9, 'october': 10, 'november': 11, 'december': 12,
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'jun': 6, 'jul': 7,
+    'aug': 8, 'sep': 9, 'sept': 9, 'oct': 10, 'nov': 11, 'dec': 12
+}
+
+def _select_first(tree, selectors):
+    """依選擇器優先順序返回第一個命中的元素（合併查詢會改以文件順序決定）"""
+    for selector in selectors:
+        elems = selector(tree)
+        if elems:
+            return elems[0]
+    return None
+
+def _close_parser(parser):
+    """結束增量解析並取得根元素，空白回應沒有任何元素時返回 None"""
+    try:
+        return parser.close()
+    except etree.XMLSyntaxError:
+        return None
+
+@dataclass(slots=True)
+class Article:
+    """單篇文章的爬取結果"""
+    url: str
+    title: str = ''
+    content: str = ''
+    author: str = ''
+    publish_date: str = ''
+    tags: list = field(default_factory=list)
+    scraped_at: str = ''
+
 class CNNWorldScraper:
     def __init__(self, today_only=True, output_dir='cnn_news'):
         self.base_url = "https://edition.cnn.com"
@@ -21,6 +143,19 @@ class CNNWorldScraper:
         self.today_date = datetime.now().date()
         self.output_dir = output_dir
         
+        # 今天日期在URL中可能出現的形式，只需計算一次
+        d = self.today_date
+        self._today_url_patterns = (
+            d.strftime('%Y/%m/%d'),
+            d.strftime('%Y-%m-%d'),
+            d.strftime('%Y%m%d'),
+        )
+        self._year_tokens = (str(d.year - 1), str(d.year))
+        
+        # 同一URL常被多個選擇器重複命中，快取判斷結果
+        self._today_url_cache = {}
+        self._valid_url_cache = {}
+        
         # 創建輸出目錄
         self.create_output_directory()
         
@@ -32,8 +167,22 @@ class CNNWorldScraper:
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
         }
-        self.session = requests.Session()
-        self.session.headers.update(self.headers)
+        self.client = None
+        
+    async def __aenter__(self):
+        # 所有文章同源 (edition.cnn.com)，HTTP/2 可在單一連線上多工傳輸並行請求
+        self.client = httpx.AsyncClient(
+            http2=True,
+            headers=self.headers,
+            follow_redirects=True,  # httpx 預設不跟隨重新導向，www.cnn.com 等連結常會轉址
+            timeout=10.0,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+        )
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.client.aclose()
+        self.client = None
         
     def create_output_directory(self):
         """創建輸出目錄"""
@@ -48,69 +197,70 @@ class CNNWorldScraper:
             # 如果無法創建目錄，使用當前目錄
             self.output_dir = '.'
         
-    def get_page(self, url, retries=3):
-        """獲取網頁內容"""
+    async def _stream_with_retries(self, url, consume, retries=3, limiter=None):
+        """串流獲取網頁並交給 consume 處理回應，失敗時以指數退避重試"""
         for attempt in range(retries):
+            if limiter is not None:
+                await limiter.acquire()  # 每次嘗試（含重試）都要取得令牌，速率才是真正的上限
             try:
-                response = self.session.get(url, timeout=10)
-                response.raise_for_status()
-                return response
-            except requests.exceptions.RequestException as e:
+                async with self.client.stream('GET', url) as response:
+                    response.raise_for_status()
+                    return await consume(response)
+            except httpx.HTTPError as e:
                 logger.warning(f"嘗試 {attempt + 1} 失敗: {e}")
                 if attempt < retries - 1:
-                    time.sleep(2 ** attempt)  # 指數退避
+                    await asyncio.sleep(2 ** attempt)  # 指數退避
                 else:
                     logger.error(f"無法獲取頁面: {url}")
                     return None
     
-    def extract_article_urls(self, soup):
-        """從頁面中提取文章URL"""
+    async def get_tree(self, url, retries=3, limiter=None):
+        """串流下載網頁並逐塊餵給lxml解析器，不保留完整的回應bytes"""
+        return await self._stream_with_retries(url, self._parse_tree, retries, limiter)
+    
+    async def _parse_tree(self, response):
+        """將回應逐塊解析為文件樹"""
+        # 依回應標頭的字元集解碼（未指定時為 utf-8），避免 lxml 誤判為 Latin-1
+        parser = lxml_html.HTMLParser(encoding=response.encoding)
+        # 同一個 lxml 解析器的 feed/close 必須在同一執行緒，跨執行緒驅動會破壞 libxml2 的狀態
+        async for chunk in response.aiter_bytes(65536):
+            parser.feed(chunk)
+        return _close_parser(parser)
+    
+    async def stream_article_urls(self, url, limit=None, retries=3):
+        """串流下載列表頁，邊接收邊解析<a>標籤，收集到 limit 個URL即提前停止"""
+        return await self._stream_with_retries(
+            url, lambda response: self._collect_article_urls(response, limit), retries)
+    
+    async def _collect_article_urls(self, response, limit):
+        """以 pull parser 從回應中收集有效的文章URL"""
+        parser = etree.HTMLPullParser(events=('start',), encoding=response.encoding)
         article_urls = set()
-        
-        # 尋找文章連結的各種可能選擇器
-        selectors = [
-            'a[href*="/world/"]',
-            'a[href*="/2024/"]',
-            'a[href*="/2025/"]',
-            '.card a',
-            '.container__link',
-            '.cd__headline-text',
-            'a.cd__headline-text',
-            '[data-module-name="card"] a'
-        ]
-        
-        for selector in selectors:
-            links = soup.select(selector)
-            for link in links:
-                href = link.get('href')
-                if href:
-                    # 轉換為絕對URL
-                    full_url = urljoin(self.base_url, href)
-                    
-                    # 過濾有效的文章URL
-                    if self.is_valid_article_url(full_url):
-                        article_urls.add(full_url)
-        
+        async for chunk in response.aiter_bytes(8192):
+            parser.feed(chunk)
+            for _, elem in parser.read_events():
+                if elem.tag == 'a':
+                    href = elem.get('href')
+                    if href:
+                        # 轉換為絕對URL並過濾有效的文章URL
+                        full_url = urljoin(self.base_url, href)
+                        if self.is_valid_article_url(full_url):
+                            article_urls.add(full_url)
+            if limit and len(article_urls) >= limit:
+                break
         return list(article_urls)
     
     def is_today_article(self, url):
         """檢查文章是否為今天發布"""
         if not self.today_only:
             return True
-            
-        # 從URL中提取日期
-        today_str = self.today_date.strftime('%Y/%m/%d')
-        today_patterns = [
-            self.today_date.strftime('%Y/%m/%d'),
-            self.today_date.strftime('%Y/%m/%d').replace('/', '-'),
-            self.today_date.strftime('%Y%m%d')
-        ]
-        
-        for pattern in today_patterns:
-            if pattern in url:
-                return True
         
-        return False
+        cached = self._today_url_cache.get(url)
+        if cached is None:
+            # 從URL中提取日期
+            cached = any(pattern in url for pattern in self._today_url_patterns)
+            self._today_url_cache[url] = cached
+        return cached
     
     def parse_article_date(self, date_text):
         """解析文章日期文本"""
@@ -121,63 +271,76 @@ class CNNWorldScraper:
         date_text = date_text.strip().lower()
         
         # 檢查是否包含"today"或今天相關詞彙
-        today_keywords = ['today', 'just now', 'minutes ago', 'hours ago', 'hour ago', 'minute ago']
-        for keyword in today_keywords:
+        for keyword in _TODAY_KEYWORDS:
             if keyword in date_text:
                 return self.today_date
         
-        # 嘗試解析各種日期格式
-        date_patterns = [
-            r'(\d{1,2})/(\d{1,2})/(\d{4})',  # MM/DD/YYYY
-            r'(\d{4})-(\d{1,2})-(\d{1,2})',  # YYYY-MM-DD
-            r'(\d{1,2})-(\d{1,2})-(\d{4})',  # DD-MM-YYYY
-            r'(\w+)\s+(\d{1,2}),\s+(\d{4})', # Month DD, YYYY
-            r'(\d{1,2})\s+(\w+)\s+(\d{4})',  # DD Month YYYY
-        ]
-        
-        for pattern in date_patterns:
-            match = re.search(pattern, date_text)
-            if match:
+        # ISO8601 快速路徑 (YYYY-MM-DD...)：CNN 的 datetime 屬性多為此格式，不需跑正則
+        if len(date_text) >= 10 and date_text[4] == '-' and date_text[7] == '-':
+            year, month, day = date_text[0:4], date_text[5:7], date_text[8:10]
+            # int() 也接受 '+'、'_'、空白與非ASCII數字，先確認都是固定寬度的ASCII數字
+            if all(part.isascii() and part.isdigit() for part in (year, month, day)):
                 try:
-                    groups = match.groups()
-                    if len(groups) == 3:
-                        # 根據不同格式解析
-                        if pattern == date_patterns[0]:  # MM/DD/YYYY
-                            month, day, year = groups
-                            return datetime(int(year), int(month), int(day)).date()
-                        elif pattern == date_patterns[1]:  # YYYY-MM-DD
-                            year, month, day = groups
-                            return datetime(int(year), int(month), int(day)).date()
-                        elif pattern == date_patterns[2]:  # DD-MM-YYYY
-                            day, month, year = groups
-                            return datetime(int(year), int(month), int(day)).date()
-                        elif pattern == date_patterns[3]:  # Month DD, YYYY
-                            month_name, day, year = groups
-                            month_dict = {
-                                'january': 1, 'february': 2, 'march': 3, 'april': 4,
-                                'may': 5, 'june': 6, 'july': 7, 'august': 8,
-                                'september': 9, 'october': 10, 'november': 11, 'december': 12
-                            }
-                            month = month_dict.get(month_name.lower())
-                            if month:
-                                return datetime(int(year), month, int(day)).date()
-                        elif pattern == date_patterns[4]:  # DD Month YYYY
-                            day, month_name, year = groups
-                            month_dict = {
-                                'january': 1, 'february': 2, 'march': 3, 'april': 4,
-                                'may': 5, 'june': 6, 'july': 7, 'august': 8,
-                                'september': 9, 'october': 10, 'november': 11, 'december': 12
-                            }
-                            month = month_dict.get(month_name.lower())
-                            if month:
-                                return datetime(int(year), month, int(day)).date()
-                except (ValueError, TypeError):
-                    continue
+                    return datetime(int(year), int(month), int(day)).date()
+                except ValueError:
+                    pass
+        
+        # 嘗試解析各種日期格式
+        for match in _DATE_RE.finditer(date_text):
+            # 外層具名群組最後閉合，lastindex 即指向它，內層三個群組緊接其後
+            kind = match.lastgroup
+            index = match.lastindex
+            groups = match.group(index + 1, index + 2, index + 3)
+            try:
+                # 根據不同格式解析
+                if kind == 'mdy':  # MM/DD/YYYY
+                    month, day, year = groups
+                    return datetime(int(year), int(month), int(day)).date()
+                elif kind == 'ymd':  # YYYY-MM-DD
+                    year, month, day = groups
+                    return datetime(int(year), int(month), int(day)).date()
+                elif kind == 'dmy':  # DD-MM-YYYY
+                    day, month, year = groups
+                    return datetime(int(year), int(month), int(day)).date()
+                elif kind == 'mdy_name':  # Month DD, YYYY
+                    month_name, day, year = groups
+                    month = _MONTH_NAMES.get(month_name.lower())
+                    if month:
+                        return datetime(int(year), month, int(day)).date()
+                elif kind == 'dmy_name':  # DD Month YYYY
+                    day, month_name, year = groups
+                    month = _MONTH_NAMES.get(month_name.lower())
+                    if month:
+                        return datetime(int(year), month, int(day)).date()
+            except ValueError:
+                continue
         
         return None
     
     def is_valid_article_url(self, url):
         """檢查是否為有效的文章URL"""
+        cached = self._valid_url_cache.get(url)
+        if cached is None:
+            cached = self._check_article_url(url)
+            self._valid_url_cache[url] = cached
+        return cached
+    
+    def _check_article_url(self, url):
+        """實際執行URL檢查（結果由 is_valid_article_url 快取）"""
+        # 先用便宜的子字串檢查排除大部分連結，避免每個URL都跑 urlparse
+        if 'cnn.com' not in url:
+            return False
+        
+        # 過濾不需要的路徑（只看查詢字串與片段之前的部分）
+        head = url.split('?', 1)[0].split('#', 1)[0]
+        if _EXCLUDE_AC is not None:
+            if next(_EXCLUDE_AC.iter(head), None) is not None:
+                return False
+        else:
+            for excluded in _EXCLUDED_PATHS:
+                if excluded in head:
+                    return False
+        
         parsed = urlparse(url)
         
         # 基本檢查
@@ -187,20 +350,9 @@ class CNNWorldScraper:
         # 檢查是否為CNN域名
         if 'cnn.com' not in parsed.netloc:
             return False
-            
-        # 過濾不需要的路徑
-        excluded_paths = [
-            '/videos/', '/video/', '/gallery/', '/galleries/',
-            '/live-news/', '/profiles/', '/about/', '/contact/',
-            '/search/', '/newsletters/', '/audio/', '/podcasts/'
-        ]
-        
-        for excluded in excluded_paths:
-            if excluded in parsed.path:
-                return False
         
         # 檢查是否包含年份（通常文章URL包含年份）
-        if any(year in parsed.path for year in ['2024', '2025']):
+        if any(year in parsed.path for year in self._year_tokens):
             # 如果只要今天的新聞，進一步檢查日期
             if self.today_only:
                 return self.is_today_article(url)
@@ -220,196 +372,119 @@ class CNNWorldScraper:
             return True
             
         # 檢查發布日期
-        if article_data.get('publish_date'):
-            parsed_date = self.parse_article_date(article_data['publish_date'])
+        if article_data.publish_date:
+            parsed_date = self.parse_article_date(article_data.publish_date)
             if parsed_date:
                 return parsed_date == self.today_date
         
         # 檢查URL中的日期
-        return self.is_today_article(article_data.get('url', ''))
+        return self.is_today_article(article_data.url)
     
-        """檢查是否為有效的文章URL"""
-        parsed = urlparse(url)
-        
-        # 基本檢查
-        if not parsed.scheme or not parsed.netloc:
-            return False
-            
-        # 檢查是否為CNN域名
-        if 'cnn.com' not in parsed.netloc:
-            return False
-            
-        # 過濾不需要的路徑
-        excluded_paths = [
-            '/videos/', '/video/', '/gallery/', '/galleries/',
-            '/live-news/', '/profiles/', '/about/', '/contact/',
-            '/search/', '/newsletters/', '/audio/', '/podcasts/'
-        ]
-        
-        for excluded in excluded_paths:
-            if excluded in parsed.path:
-                return False
-        
-        # 檢查是否包含年份（通常文章URL包含年份）
-        if any(year in parsed.path for year in ['2024', '2025']):
-            return True
-            
-        # 檢查是否為world相關文章
-        if '/world/' in parsed.path:
-            return True
-            
-        return False
-    
-    def extract_article_content(self, url):
+    async def extract_article_content(self, url, limiter=None):
         """提取文章內容"""
-        response = self.get_page(url)
-        if not response:
+        # 解析隨下載逐塊進行，不再先組出完整的bytes
+        tree = await self.get_tree(url, limiter=limiter)
+        if tree is None:
             return None
-            
-        soup = BeautifulSoup(response.content, 'html.parser')
         
+        # 選擇器比對與文字抽取是CPU工作，交給執行緒處理，讓事件迴圈繼續接收其他文章
+        return await asyncio.to_thread(self.parse_article, tree, url)
+    
+    def parse_article(self, tree, url):
+        """從已解析的文件樹提取文章內容"""
         # 嘗試提取文章信息
-        article_data = {
-            'url': url,
-            'title': '',
-            'content': '',
-            'author': '',
-            'publish_date': '',
-            'tags': [],
-            'scraped_at': datetime.now().isoformat()
-        }
+        article_data = Article(url=url, scraped_at=datetime.now().isoformat())
         
         # 提取標題
-        title_selectors = [
-            'h1.headline__text',
-            'h1[data-editable="headline"]',
-            'h1.pg-headline',
-            'h1',
-            '.headline__text'
-        ]
-        
-        for selector in title_selectors:
-            title_elem = soup.select_one(selector)
-            if title_elem:
-                article_data['title'] = title_elem.get_text(strip=True)
-                break
+        title_elem = _select_first(tree, _TITLE_SELS)
+        if title_elem is not None:
+            article_data.title = title_elem.text_content().strip()
         
         # 提取內容
-        content_selectors = [
-            '.zn-body__paragraph',
-            '.paragraph',
-            '.zn-body__paragraph p',
-            '[data-component-name="paragraph"] p',
-            '.BasicArticle__paragraph'
-        ]
-        
         content_parts = []
-        for selector in content_selectors:
-            paragraphs = soup.select(selector)
-            for p in paragraphs:
-                text = p.get_text(strip=True)
-                if text and len(text) > 20:  # 過濾太短的段落
-                    content_parts.append(text)
+        for p in _CONTENT_SEL(tree):
+            text = p.text_content().strip()
+            if text and len(text) > 20:  # 過濾太短的段落
+                content_parts.append(text)
         
-        article_data['content'] = '\n\n'.join(content_parts)
+        article_data.content = '\n\n'.join(content_parts)
         
         # 提取作者
-        author_selectors = [
-            '.byline__name',
-            '.metadata__byline',
-            '[data-module="ArticleByline"] .byline__name',
-            '.byline'
-        ]
-        
-        for selector in author_selectors:
-            author_elem = soup.select_one(selector)
-            if author_elem:
-                article_data['author'] = author_elem.get_text(strip=True)
-                break
+        author_elem = _select_first(tree, _AUTHOR_SELS)
+        if author_elem is not None:
+            article_data.author = author_elem.text_content().strip()
         
         # 提取發布日期
-        date_selectors = [
-            '.timestamp',
-            '.metadata__date',
-            '[data-module="ArticleByline"] .timestamp',
-            'time',
-            '.byline__timestamp',
-            '.article-meta time'
-        ]
-        
-        for selector in date_selectors:
-            date_elem = soup.select_one(selector)
-            if date_elem:
-                # 嘗試從多個屬性獲取日期
-                date_text = (date_elem.get('datetime') or 
-                           date_elem.get('data-timestamp') or 
-                           date_elem.get_text(strip=True))
-                article_data['publish_date'] = date_text
-                break
+        date_elem = _select_first(tree, _DATE_SELS)
+        if date_elem is not None:
+            # 嘗試從多個屬性獲取日期
+            date_text = (date_elem.get('datetime') or 
+                       date_elem.get('data-timestamp') or 
+                       date_elem.text_content().strip())
+            article_data.publish_date = date_text
         
         # 提取標籤
-        tag_selectors = [
-            '.metadata__section',
-            '.breadcrumb__link',
-            '.zn-tag'
-        ]
-        
         tags = []
-        for selector in tag_selectors:
-            tag_elems = soup.select(selector)
-            for tag_elem in tag_elems:
-                tag_text = tag_elem.get_text(strip=True)
-                if tag_text and tag_text not in tags:
-                    tags.append(tag_text)
+        seen = set()  # 以集合去重，保留原本的出現順序
+        for tag_elem in _TAG_SEL(tree):
+            tag_text = tag_elem.text_content().strip()
+            if tag_text and tag_text not in seen:
+                seen.add(tag_text)
+                tags.append(tag_text)
         
-        article_data['tags'] = tags
+        article_data.tags = tags
         
         return article_data
     
-    def scrape_world_news(self, max_articles=20):
+    async def _fetch_one(self, semaphore, limiter, url):
+        """在並行上限與速率限制內爬取單篇文章"""
+        async with semaphore:
+            logger.info(f"正在爬取文章: {url}")
+            # 令牌桶限速以避免被封鎖，允許短暫突發而不是每篇固定延遲
+            return await self.extract_article_content(url, limiter)
+    
+    async def scrape_world_news(self, max_articles=20):
         """爬取CNN世界新聞"""
         logger.info("開始爬取CNN世界新聞...")
         
-        # 獲取世界新聞頁面
-        response = self.get_page(self.world_url)
-        if not response:
+        # 串流解析世界新聞頁面，收集到足夠的候選URL即停止下載
+        limit = max_articles * 3 if max_articles else None
+        article_urls = await self.stream_article_urls(self.world_url, limit=limit)
+        if article_urls is None:
             logger.error("無法獲取世界新聞頁面")
             return []
         
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # 提取文章URL
-        article_urls = self.extract_article_urls(soup)
         logger.info(f"找到 {len(article_urls)} 個文章URL")
         
         # 限制文章數量
         if max_articles:
             article_urls = article_urls[:max_articles]
         
-        # 爬取文章內容
+        # 並行爬取文章內容
+        semaphore = asyncio.Semaphore(8)
+        limiter = AsyncLimiter(5, 1)  # 平均每秒最多 5 個請求
+        tasks = [self._fetch_one(semaphore, limiter, url) for url in article_urls]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        
         articles = []
         today_articles = []
         
-        for i, url in enumerate(article_urls, 1):
-            logger.info(f"正在爬取文章 {i}/{len(article_urls)}: {url}")
-            
-            article_data = self.extract_article_content(url)
-            if article_data and article_data['title']:
+        for url, article_data in zip(article_urls, results):
+            if isinstance(article_data, Exception):
+                logger.warning(f"爬取文章時發生錯誤 {url}: {article_data}")
+            elif article_data and article_data.title:
                 # 如果啟用了今天限制，檢查是否為今天的新聞
                 if self.today_only:
                     if self.is_today_by_content(article_data):
                         today_articles.append(article_data)
-                        logger.info(f"✓ 今天的新聞: {article_data['title'][:50]}...")
+                        logger.info(f"✓ 今天的新聞: {article_data.title[:50]}...")
                     else:
-                        logger.info(f"✗ 非今天的新聞，跳過: {article_data['title'][:50]}...")
+                        logger.info(f"✗ 非今天的新聞，跳過: {article_data.title[:50]}...")
                 else:
                     articles.append(article_data)
-                    logger.info(f"成功爬取: {article_data['title'][:50]}...")
+                    logger.info(f"成功爬取: {article_data.title[:50]}...")
             else:
                 logger.warning(f"無法爬取文章內容: {url}")
-            
-            # 添加延遲以避免被封鎖
-            time.sleep(1)
         
         # 返回相應的結果
         final_articles = today_articles if self.today_only else articles
@@ -423,8 +498,12 @@ class CNNWorldScraper:
     
     def save_to_json(self, articles, filename='cnn_world_news.json'):
         """保存為JSON文件"""
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(articles, f, ensure_ascii=False, indent=2)
+        if orjson is not None:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(articles, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(filename, 'w', encoding='utf-8') as f:
+                json.dump([asdict(article) for article in articles], f, ensure_ascii=False, indent=2)
         logger.info(f"已保存到 {filename}")
     
     def save_to_csv(self, articles, filename='cnn_world_news.csv'):
@@ -436,14 +515,15 @@ class CNNWorldScraper:
         fieldnames = ['title', 'author', 'publish_date', 'url', 'content', 'tags', 'scraped_at']
         
         with open(filename, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
+            writer = csv.writer(f)
+            writer.writerow(fieldnames)
             
-            for article in articles:
-                # 處理標籤列表
-                article_copy = article.copy()
-                article_copy['tags'] = ', '.join(article['tags']) if article['tags'] else ''
-                writer.writerow(article_copy)
+            # 直接產生每列的值並一次批次寫入，不再逐篇複製字典
+            writer.writerows(
+                (article.title, article.author, article.publish_date, article.url,
+                 article.content, ', '.join(article.tags), article.scraped_at)
+                for article in articles
+            )
         
         logger.info(f"已保存到 {filename}")
     
@@ -463,13 +543,13 @@ class CNNWorldScraper:
         
         print(f"\n=== 前5篇文章標題 ===")
         for i, article in enumerate(articles[:5], 1):
-            print(f"{i}. {article['title']}")
-            print(f"   作者: {article['author'] or '未知'}")
-            print(f"   發布時間: {article['publish_date'] or '未知'}")
-            print(f"   URL: {article['url']}")
+            print(f"{i}. {article.title}")
+            print(f"   作者: {article.author or '未知'}")
+            print(f"   發布時間: {article.publish_date or '未知'}")
+            print(f"   URL: {article.url}")
             print()
 
-def main():
+async def main():
     today_only = True
     max_articles = 20
 
@@ -482,7 +562,8 @@ def main():
         print(f"開始爬取CNN世界新聞，最多 {max_articles} 篇...")
 
     # 爬取文章
-    articles = scraper.scrape_world_news(max_articles=max_articles)
+    async with scraper:
+        articles = await scraper.scrape_world_news(max_articles=max_articles)
 
     # 存檔並列印摘要
     if articles:
@@ -499,4 +580,4 @@ def main():
         print(msg)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    asyncio.run(main())
\ No newline at end of file